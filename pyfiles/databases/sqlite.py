@@ -9,19 +9,50 @@ from aiosqlite import (
     connect, 
     Connection, 
     Cursor, 
-    Row
+    OperationalError,
+    Row,
+    sqlite_version_info
 )
-from langchain_classic.docstore.document import Document
+from langchain_core.documents import Document
 from typing import (
     List, 
     Dict, 
     Tuple, 
-    Iterable
+    Iterable,
+    Callable,
+    Awaitable,
+    TypeVar
 )
 
 ## Internal imports
 from pyfiles.bases.logger import logger
 
+## Indexes on the metadata fields used to filter documents
+## The expressions must match the queries exactly for SQLite to use them
+_INDEXES: Tuple[str, ...] = (
+    "CREATE INDEX IF NOT EXISTS idx_documents_group ON documents (json_extract(metadata, '$.group'))",
+    "CREATE INDEX IF NOT EXISTS idx_documents_source ON documents (json_extract(metadata, '$.source'), json_extract(metadata, '$.group'))",
+    "CREATE INDEX IF NOT EXISTS idx_documents_codebase_type ON documents (json_extract(metadata, '$.codebase_type'))"
+)
+
+## Queries filtered on the indexed metadata fields, served by the indexes above
+_SELECT_BY_GROUP: str = '''
+    SELECT id, content, metadata FROM documents
+    WHERE json_extract(metadata, '$.group') = ?
+'''
+_DELETE_BY_SOURCE: str = '''
+    DELETE FROM documents
+    WHERE json_extract(metadata, '$.source') = ? 
+    AND json_extract(metadata, '$.group') = ?
+'''
+_SELECT_GROUPS_BY_CODEBASE_TYPE: str = '''
+    SELECT DISTINCT json_extract(metadata, '$.group') 
+    FROM documents
+    WHERE json_extract(metadata, '$.codebase_type') = ?
+'''
+
+_T = TypeVar('_T')
+
 ## The SQLite DB manager
 class SQLiteDB:
     """
@@ -31,10 +62,18 @@ class SQLiteDB:
     ------------
         db_path: str
                 The path of the SQLite DB.
+        uri: bool
+                Whether `db_path` is an SQLite URI (e.g. `file:name?mode=memory&cache=shared`).
+                A shared-cache memory DB is freed when its last connection closes,
+                so the caller must keep a connection open for as long as the data is needed.
+        _schema_ready: bool
+                Whether the documents table is known to exist, so it isn't recreated on every connection.
+                Only cached for plain file paths; URI and `:memory:` DBs recreate it on every connection.
     """
     def __init__(
         self, 
-        db_path: str = ':memory:'
+        db_path: str = ':memory:',
+        uri: bool = False
     ):
         """
         Initialize the SQLite DB manager.
@@ -43,6 +82,10 @@ class SQLiteDB:
         ------------
             db_path: str
                 The path of the SQLite DB.
+            uri: bool
+                Whether `db_path` is an SQLite URI.
+                For a shared-cache memory URI, the caller must hold its own connection open.
+                Defaults to False.
             
         Raises
         ------------
@@ -52,6 +95,8 @@ class SQLiteDB:
         logger.info(f'⚙️ Initializing the SQLite DB')
         try:
             self.db_path = db_path
+            self.uri = uri
+            self._schema_ready: bool = False
             logger.info(f'✅ SQLite DB initialized for path `{self.db_path}`')
         except Exception as e:
             logger.error(f'❌ Problem initializing the SQLite DB: `{str(e)}`')
@@ -63,7 +108,7 @@ class SQLiteDB:
         conn: Connection
     ) -> None:
         """
-        Create the SQLite DB table for each execution.
+        Create the SQLite DB table and its metadata indexes for each execution.
 
         Args
         ------------
@@ -84,10 +129,62 @@ class SQLiteDB:
                     metadata TEXT
                 )
             ''')
+            for index in _INDEXES:
+                await conn.execute(index)
+            ## Memory and URI DBs can disappear between connections, so only cache plain files
+            self._schema_ready = self._cache_schema()
         except Exception as e:
             logger.error(f'❌ Problem creating SQLite DB table: `{str(e)}`')
             raise
 
+    ## Whether the schema can be cached between connections
+    def _cache_schema(
+        self
+    ) -> bool:
+        """
+        Check whether the documents table can be assumed to outlive a connection.
+
+        Returns
+        ------------
+            bool:
+                True for a plain file path, False for a URI or `:memory:` DB.
+        """
+        return not self.uri and self.db_path != ':memory:'
+
+    ## Run an operation on a new connection with the schema in place
+    async def _run(
+        self, 
+        operation: Callable[[Connection], Awaitable[_T]]
+    ) -> _T:
+        """
+        Open a connection, create the table if needed and run the operation on it.
+        The file may have been deleted or replaced since the schema was cached 
+        (e.g. by another manager on the same path), so a missing table resets the cache 
+        and the operation is retried once.
+
+        Args
+        ------------
+            operation: Callable[[Connection], Awaitable[_T]]
+                The operation to run on the connection.
+
+        Returns
+        ------------
+            _T:
+                The result of the operation.
+        """
+        async with connect(self.db_path, uri=self.uri) as conn:
+            if not self._schema_ready:
+                await self._create_table(conn)
+                return await operation(conn)
+            try:
+                return await operation(conn)
+            except OperationalError as e:
+                if 'no such table' not in str(e):
+                    raise
+                self._schema_ready = False
+                await self._create_table(conn)
+                return await operation(conn)
+
     ## Update documents in DB
     async def insert_documents(
         self, 
@@ -110,16 +207,19 @@ class SQLiteDB:
                 If inserting or replacing the documents fails, error is logged and raised.
         """
         try:
-            async with connect(self.db_path) as conn:
-                await self._create_table(conn)
+            ## Build all rows up front and insert them in a single batch
+            rows: List[Tuple[str, str, str]] = [
+                (doc_id, doc.page_content, dumps(doc.metadata))
+                for doc, doc_id in zip(documents, ids)
+            ]
+            async def insert(conn: Connection) -> None:
                 cursor: Cursor = await conn.cursor()
-                for doc, doc_id in zip(documents, ids):
-                    metadata_json: str = dumps(doc.metadata)
-                    await cursor.execute('''
-                        INSERT OR REPLACE INTO documents (id, content, metadata)
-                        VALUES (?, ?, ?)
-                    ''', (doc_id, doc.page_content, metadata_json))
+                await cursor.executemany('''
+                    INSERT OR REPLACE INTO documents (id, content, metadata)
+                    VALUES (?, ?, ?)
+                ''', rows)
                 await conn.commit()
+            await self._run(insert)
         except Exception as e:
             logger.error(f'❌ Problem inserting documents into SQLite DB: `{str(e)}`')
             raise
@@ -148,23 +248,20 @@ class SQLiteDB:
                 If getting the documents fails, error is logged and raised.
         """
         try:
-            async with connect(self.db_path) as conn:
-                ## Get relevant document information from DB
-                await self._create_table(conn)
+            ## Get relevant document information from DB
+            async def select(conn: Connection) -> Iterable[Row]:
                 cursor: Cursor = await conn.cursor()
-                await cursor.execute('''
-                    SELECT id, content, metadata FROM documents
-                    WHERE json_extract(metadata, '$.group') = ?
-                ''', (group,))
-                rows: Iterable[Row] = await cursor.fetchall()
-                ## Create Document for each relevant doc
-                docs: List[Tuple[str, Document]] = []
-                for row in rows:
-                    doc_id, content, metadata_str = row
-                    metadata: Dict[str, str] = loads(metadata_str)
-                    doc: Document = Document(page_content=content, metadata=metadata)
-                    docs.append((doc_id, doc))
-                return docs
+                await cursor.execute(_SELECT_BY_GROUP, (group,))
+                return await cursor.fetchall()
+            rows: Iterable[Row] = await self._run(select)
+            ## Create Document for each relevant doc
+            docs: List[Tuple[str, Document]] = []
+            for row in rows:
+                doc_id, content, metadata_str = row
+                metadata: Dict[str, str] = loads(metadata_str)
+                doc: Document = Document(page_content=content, metadata=metadata)
+                docs.append((doc_id, doc))
+            return docs
         except Exception as e:
             logger.error(f'❌ Problem getting documents by group from SQLite DB: `{str(e)}`')
             raise
@@ -188,13 +285,13 @@ class SQLiteDB:
                 If deleting the documents fails, error is logged and raised.
         """
         try:
-            async with connect(self.db_path) as conn:
-                await self._create_table(conn)
+            async def delete(conn: Connection) -> None:
                 cursor: Cursor = await conn.cursor()
                 await cursor.executemany('''
                     DELETE FROM documents WHERE id = ?
                 ''', [(doc_id,) for doc_id in doc_ids])
                 await conn.commit()
+            await self._run(delete)
         except Exception as e:
             logger.error(f'❌ Problem deleting documents by ID from SQLite DB: `{str(e)}`')
             raise
@@ -221,15 +318,11 @@ class SQLiteDB:
                 If deleting the documents fails, error is logged and raised.
         """
         try:
-            async with connect(self.db_path) as conn:
-                await self._create_table(conn)
+            async def delete(conn: Connection) -> None:
                 cursor: Cursor = await conn.cursor()
-                await cursor.executemany('''
-                    DELETE FROM documents
-                    WHERE json_extract(metadata, '$.source') = ? 
-                    AND json_extract(metadata, '$.group') = ?
-                ''', [(source, group) for source in sources])
+                await cursor.executemany(_DELETE_BY_SOURCE, [(source, group) for source in sources])
                 await conn.commit()
+            await self._run(delete)
         except Exception as e:
             logger.error(f'❌ Problem deleting documents by source from SQLite DB: `{str(e)}`')
             raise
@@ -249,6 +342,7 @@ class SQLiteDB:
         try:
             if exists(self.db_path):
                 remove(self.db_path)
+                self._schema_ready = False
         except Exception as e:
             logger.error(f'❌ Problem deleting SQLite DB file: `{str(e)}`')
             raise
@@ -278,16 +372,43 @@ class SQLiteDB:
                 If getting the codebases fails, error is logged and raised.
         """
         try:
-            async with connect(self.db_path) as conn:
-                await self._create_table(conn)
+            async def select(conn: Connection) -> Iterable[Row]:
                 cursor: Cursor = await conn.cursor()
-                await cursor.execute(f'''
-                    SELECT DISTINCT json_extract(metadata, '$.group') 
-                    FROM documents
-                    WHERE json_extract(metadata, '$.codebase_type') = "{codebase_type}"
-                ''')
-                groups: Iterable[Row] = await cursor.fetchall()
-                return list(set(g[0].rsplit('_', 1)[0] for g in groups if g[0]))
+                await cursor.execute(_SELECT_GROUPS_BY_CODEBASE_TYPE, (codebase_type,))
+                return await cursor.fetchall()
+            groups: Iterable[Row] = await self._run(select)
+            return list(set(g[0].rsplit('_', 1)[0] for g in groups if g[0]))
         except Exception as e:
             logger.error(f'❌ Problem getting codebases from SQLite DB: `{str(e)}`')
             raise
+
+    ## Optimize the DB before it is closed
+    async def close(
+        self
+    ) -> None:
+        """
+        Run `PRAGMA optimize` so the query planner statistics are fresh on the next open.
+        Each DB method uses its own short-lived connection, so this opens one for the pragmas.
+        A file DB that doesn't exist is left alone rather than created empty.
+
+        Raises
+        ------------
+            Exception:
+                If optimizing the DB fails, error is logged and raised.
+        """
+        try:
+            if self._cache_schema() and not exists(self.db_path):
+                return
+            async with connect(self.db_path, uri=self.uri) as conn:
+                ## Bound the work done by ANALYZE so closing stays cheap
+                ## This connection has run no queries, so ask for every table to be checked
+                await conn.executescript('''
+                    PRAGMA analysis_limit=400;
+                    PRAGMA optimize=0x10002;
+                ''')
+                ## Checking every table needs SQLite 3.46, so older versions analyze directly
+                if sqlite_version_info < (3, 46, 0):
+                    await conn.execute('ANALYZE')
+        except Exception as e:
+            logger.error(f'❌ Problem optimizing SQLite DB on close: `{str(e)}`')
+            raise
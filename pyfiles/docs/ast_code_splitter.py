@@ -20,7 +20,7 @@ from langchain_classic.text_splitter import (
     RecursiveCharacterTextSplitter,
     Language
 )
-from langchain_classic.schema import Document
+from langchain_core.documents import Document
 from typing import List, Dict, Any
 
 ## Internal imports
@@ -12,8 +12,7 @@ from os.path import (
     basename
 )
 from uuid import uuid4
-from gradio import File
-from langchain_classic.schema import Document
+from langchain_core.documents import Document
 from langchain_community.document_loaders import (
     PythonLoader, 
     UnstructuredMarkdownLoader
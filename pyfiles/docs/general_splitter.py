@@ -2,7 +2,7 @@
 ## This file creates a class for creating LangChain documents from free content (not Markdown or Python).
 
 ## External imports
-from langchain_classic.schema import Document
+from langchain_core.documents import Document
 from langchain_classic.text_splitter import RecursiveCharacterTextSplitter
 from typing import List
 
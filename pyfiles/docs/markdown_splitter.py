@@ -3,9 +3,9 @@
 
 ## External imports
 from os.path import basename
-from langchain_classic.schema import Document
+from langchain_core.documents import Document
 from langchain_classic.text_splitter import RecursiveCharacterTextSplitter 
-from typing import List
+from typing import List, Tuple
 
 ## Internal imports
 from pyfiles.docs.base_splitter import BaseSplitter
@@ -13,7 +13,8 @@ from pyfiles.bases.logger import logger
 
 # We use a list of separators tailored for splitting Markdown documents
 # This list is taken from LangChain's MarkdownTextSplitter class
-MARKDOWN_SEPARATORS: List[str] = [
+# It is a tuple so the shared default can't be mutated through a splitter instance
+MARKDOWN_SEPARATORS: Tuple[str, ...] = (
     "\n#{1,6} ",
     "```\n",
     "\n\\*\\*\\*+\n",
@@ -23,7 +24,7 @@ MARKDOWN_SEPARATORS: List[str] = [
     "\n",
     " ",
     "",
-]
+)
 
 ## The Markdown splitter manager
 class MarkdownSplitter(BaseSplitter):   
@@ -38,7 +39,7 @@ class MarkdownSplitter(BaseSplitter):
             The content of the document.
         chunk_size: int
             The chunk size for splitting the content into multiple documents
-        markdown_separators: List[str]
+        markdown_separators: Tuple[str, ...]
             The specific separators to use for splitting Markdown documents.
     """
     def __init__(
@@ -46,7 +47,7 @@ class MarkdownSplitter(BaseSplitter):
         source: str, 
         content: str, 
         chunk_size: int = 512, 
-        markdown_separators: List[str] = MARKDOWN_SEPARATORS
+        markdown_separators: Tuple[str, ...] = MARKDOWN_SEPARATORS
     ):
         """
         Initialize the Markdown splitter.
@@ -59,7 +60,7 @@ class MarkdownSplitter(BaseSplitter):
                 The content of the document.
             chunk_size: int
                 The chunk size for splitting the content into multiple documents.
-            markdown_separators: List[str]
+            markdown_separators: Tuple[str, ...]
                 The specific separators to use for splitting Markdown documents.
         """
         super().__init__(
@@ -99,7 +100,7 @@ class MarkdownSplitter(BaseSplitter):
                 text_splitter: RecursiveCharacterTextSplitter = RecursiveCharacterTextSplitter(
                     chunk_size=self.chunk_size,
                     chunk_overlap=int(self.chunk_size / 10),
-                    separators=self.markdown_separators,
+                    separators=list(self.markdown_separators),
                 )
                 docs.extend(text_splitter.split_documents([doc]))
             return docs
@@ -0,0 +1,51 @@
+### tests.unit.async_case
+## An async test case that shares one event loop across all tests of a class.
+
+## External imports
+from asyncio import Runner
+from unittest import IsolatedAsyncioTestCase
+
+
+class SharedLoopTestCase(IsolatedAsyncioTestCase):
+    """
+    An IsolatedAsyncioTestCase that runs every test of the class on one event loop.
+
+    IsolatedAsyncioTestCase creates and closes a new asyncio runner for every test method.
+    For tests that only await mocks or short-lived connections this is pure overhead,
+    so the runner is created once in setUpClass and closed with the class instead.
+    Tests must not leave tasks running, since they would outlive the test on the shared loop.
+
+    The runner hooks are private to IsolatedAsyncioTestCase, so the loop is only shared
+    while they exist; otherwise the stock per-test runner is used. A `loop_factory` set
+    on the class is passed to the shared runner, as IsolatedAsyncioTestCase does from 3.13.
+    """
+    _shared_runner: Runner | None = None
+    _can_share_runner: bool = (
+        hasattr(IsolatedAsyncioTestCase, '_setupAsyncioRunner')
+        and hasattr(IsolatedAsyncioTestCase, '_tearDownAsyncioRunner')
+    )
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        if cls._can_share_runner:
+            cls._shared_runner = Runner(debug=True, loop_factory=getattr(cls, 'loop_factory', None))
+            cls.addClassCleanup(cls._close_shared_runner)
+
+    @classmethod
+    def _close_shared_runner(cls) -> None:
+        cls._shared_runner.close()
+        cls._shared_runner = None
+
+    def _setupAsyncioRunner(self) -> None:
+        if self._shared_runner is None:
+            super()._setupAsyncioRunner()
+            return
+        self._asyncioRunner = self._shared_runner
+
+    def _tearDownAsyncioRunner(self) -> None:
+        if self._shared_runner is None:
+            super()._tearDownAsyncioRunner()
+            return
+        ## The shared runner is closed with the class, not after each test
+        self._asyncioRunner = None
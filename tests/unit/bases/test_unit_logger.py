@@ -2,17 +2,16 @@
 from unittest import TestCase
 from unittest.mock import patch, MagicMock
 from datetime import datetime
-from logging import Formatter, LogRecord
+from logging import LogRecord
 from pyfiles.bases.logger import ElapsedFormatter, with_spinner
+from tests.unit.mocks import spec_mock
 
 class TestLoggerUnit(TestCase):
     def test_format_failure(self):
         """
         Test failed invoking of format.
         """
-        record = MagicMock(spec=LogRecord)
-        mock_formatter = MagicMock(spec=Formatter)
-        mock_formatter.format.side_effect = Exception
+        record = spec_mock(LogRecord)
         formatter = ElapsedFormatter(start_time=datetime.now())
         with self.assertRaises(Exception):
             formatter.format(record)
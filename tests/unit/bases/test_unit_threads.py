@@ -13,7 +13,7 @@ class TestThreadsUnit(TestCase):
         self.max_threads = 1000
 
 class TestAThreadsUnit(IsolatedAsyncioTestCase):
-    def setUp(self):
+    async def asyncSetUp(self):
         self.codebase_type = "test_type"
         self.milvus_db = MagicMock()
         self.sqlite_db = MagicMock()
@@ -22,6 +22,13 @@ class TestAThreadsUnit(IsolatedAsyncioTestCase):
         self.sqlite_db.get_documents_by_group = AsyncMock()
         self.sqlite_db.delete_documents_by_id = AsyncMock()
         self.sqlite_db.insert_documents = AsyncMock()
+        self.threads = Threads(
+            codebase_type=self.codebase_type,
+            milvus_db=self.milvus_db,
+            sqlite_db=self.sqlite_db,
+            models=self.models,
+            codebase=self.codebase
+        )
 
     async def test_load_all_from_sqlite_success(self):
         """
@@ -31,14 +38,7 @@ class TestAThreadsUnit(IsolatedAsyncioTestCase):
         group = f"{self.codebase}_{load_type}"
         mock_results = [("doc1", MagicMock(page_content="test", metadata={"source": "src1", "group": group}))] 
         self.sqlite_db.get_documents_by_group.return_value = mock_results
-        threads = Threads(
-            codebase_type=self.codebase_type,
-            milvus_db=self.milvus_db,
-            sqlite_db=self.sqlite_db,
-            models=self.models,
-            codebase=self.codebase
-        )
-        result = await threads.load_all_from_sqlite(load_type)
+        result = await self.threads.load_all_from_sqlite(load_type)
         expected = {
             "doc1": {
                 'content': "test",
@@ -54,15 +54,9 @@ class TestAThreadsUnit(IsolatedAsyncioTestCase):
         """
         load_type = "code"
         self.sqlite_db.get_documents_by_group.side_effect = Exception("Load failed")
-        threads = Threads(
-            codebase_type=self.codebase_type,
-            milvus_db=self.milvus_db,
-            sqlite_db=self.sqlite_db,
-            models=self.models,
-            codebase=self.codebase
-        )
-        with self.assertRaises(Exception):
-            await threads.load_all_from_sqlite(load_type)
+        with self.assertRaises(Exception) as ctx:
+            await self.threads.load_all_from_sqlite(load_type)
+        self.assertEqual(str(ctx.exception), "Load failed")
 
     async def test_get_list_success(self):
         """
@@ -74,14 +68,7 @@ class TestAThreadsUnit(IsolatedAsyncioTestCase):
             "thread2": {"source": "file2.py", "content": "test content"}
         }
         with patch.object(Threads, 'load_all_from_sqlite', return_value=mock_state):
-            threads = Threads(
-                codebase_type=self.codebase_type,
-                milvus_db=self.milvus_db,
-                sqlite_db=self.sqlite_db,
-                models=self.models,
-                codebase=self.codebase
-            )
-            result = await threads.get_list(load_type)
+            result = await self.threads.get_list(load_type)
             self.assertEqual(len(result), 2)
             self.assertIn(("file1.py", "thread1"), result)
             self.assertIn(("file2.py", "thread2"), result)
@@ -92,15 +79,9 @@ class TestAThreadsUnit(IsolatedAsyncioTestCase):
         """
         load_type = "code"
         with patch.object(Threads, 'load_all_from_sqlite', side_effect=Exception("List failed")):
-            threads = Threads(
-                codebase_type=self.codebase_type,
-                milvus_db=self.milvus_db,
-                sqlite_db=self.sqlite_db,
-                models=self.models,
-                codebase=self.codebase
-            )
-            with self.assertRaises(Exception):
-                await threads.get_list(load_type)
+            with self.assertRaises(Exception) as ctx:
+                await self.threads.get_list(load_type)
+            self.assertEqual(str(ctx.exception), "List failed")
 
     async def test_delete_success(self):
         """
@@ -113,16 +94,8 @@ class TestAThreadsUnit(IsolatedAsyncioTestCase):
         }
         with patch.object(Threads, 'load_all_from_sqlite', return_value=mock_state):
             self.sqlite_db.delete_documents_by_id.return_value = None
-            threads = Threads(
-                codebase_type=self.codebase_type,
-                milvus_db=self.milvus_db,
-                sqlite_db=self.sqlite_db,
-                models=self.models,
-                codebase=self.codebase
-            )
-            result = await threads.delete(load_type, thread_id)
-            self.assertIsInstance(result, tuple)
-            self.assertEqual(len(result), 3)
+            result = await self.threads.delete(load_type, thread_id)
+            self.assertEqual((isinstance(result, tuple), len(result)), (True, 3))
             self.assertIn("Deleted thread", result[2])
 
     async def test_delete_exception(self):
@@ -132,15 +105,9 @@ class TestAThreadsUnit(IsolatedAsyncioTestCase):
         load_type = "code"
         thread_id = "thread123"
         with patch.object(Threads, 'load_all_from_sqlite', side_effect=Exception("Delete failed")):
-            threads = Threads(
-                codebase_type=self.codebase_type,
-                milvus_db=self.milvus_db,
-                sqlite_db=self.sqlite_db,
-                models=self.models,
-                codebase=self.codebase
-            )
-            with self.assertRaises(Exception):
-                await threads.delete(load_type, thread_id)
+            with self.assertRaises(Exception) as ctx:
+                await self.threads.delete(load_type, thread_id)
+            self.assertEqual(str(ctx.exception), "Delete failed")
 
     async def test_create_threads_success(self):
         """
@@ -152,16 +119,8 @@ class TestAThreadsUnit(IsolatedAsyncioTestCase):
         self.sqlite_db.get_documents_by_group.return_value = []
         mock_list_result = [("file.py", "thread123")]
         with patch.object(Threads, 'get_list', return_value=mock_list_result):
-            threads = Threads(
-                codebase_type=self.codebase_type,
-                milvus_db=self.milvus_db,
-                sqlite_db=self.sqlite_db,
-                models=self.models,
-                codebase=self.codebase
-            )
-            result = await threads.create(load_type, name=name)
-            self.assertIsInstance(result, tuple)
-            self.assertEqual(len(result), 4)
+            result = await self.threads.create(load_type, name=name)
+            self.assertEqual((isinstance(result, tuple), len(result)), (True, 4))
 
     async def test_create_exception(self):
         """
@@ -169,15 +128,9 @@ class TestAThreadsUnit(IsolatedAsyncioTestCase):
         """
         load_type = "threads"
         with patch.object(Threads, 'get_list', side_effect=Exception("Create failed")):
-            threads = Threads(
-                codebase_type=self.codebase_type,
-                milvus_db=self.milvus_db,
-                sqlite_db=self.sqlite_db,
-                models=self.models,
-                codebase=self.codebase
-            )
-            with self.assertRaises(Exception):
-                await threads.create(load_type)
+            with self.assertRaises(Exception) as ctx:
+                await self.threads.create(load_type)
+            self.assertEqual(str(ctx.exception), "Create failed")
 
     async def test_get_state_details_success(self):
         """
@@ -189,14 +142,7 @@ class TestAThreadsUnit(IsolatedAsyncioTestCase):
             thread_id: {"content": "test content", "history": ["msg1"]}
         }
         with patch.object(Threads, 'load_all_from_sqlite', return_value=mock_state):
-            threads = Threads(
-                codebase_type=self.codebase_type,
-                milvus_db=self.milvus_db,
-                sqlite_db=self.sqlite_db,
-                models=self.models,
-                codebase=self.codebase
-            )
-            result = await threads.get_state_details(load_type, thread_id)
+            result = await self.threads.get_state_details(load_type, thread_id)
             self.assertEqual(result, "test content")
 
     async def test_get_state_details_exception(self):
@@ -206,12 +152,6 @@ class TestAThreadsUnit(IsolatedAsyncioTestCase):
         load_type = "code"
         thread_id = "thread123"
         with patch.object(Threads, 'load_all_from_sqlite', side_effect=Exception("State failed")):
-            threads = Threads(
-                codebase_type=self.codebase_type,
-                milvus_db=self.milvus_db,
-                sqlite_db=self.sqlite_db,
-                models=self.models,
-                codebase=self.codebase
-            )
-            with self.assertRaises(Exception):
-                await threads.get_state_details(load_type, thread_id)
+            with self.assertRaises(Exception) as ctx:
+                await self.threads.get_state_details(load_type, thread_id)
+            self.assertEqual(str(ctx.exception), "State failed")
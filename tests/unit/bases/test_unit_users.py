@@ -1,17 +1,30 @@
 
 ## tests.unit.bases.test_unit_users
+from copy import copy
 from unittest import TestCase, IsolatedAsyncioTestCase
 from unittest.mock import MagicMock, patch, AsyncMock
 from pyfiles.bases.users import Users
 
-class TestUsersUnit(TestCase):
+class UsersFixtureMixin:
+    """
+    Build the mocked models and client plus a prototype Users handler once per class.
+    Each test gets a shallow copy of the prototype and freshly reset mocks.
+    """
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.mock_client = MagicMock()
+        cls.mock_models = MagicMock()
+        cls.mock_client.client = MagicMock()
+        cls.mock_client.client.list_databases = MagicMock()
+        cls._users_proto = Users(cls.mock_models, cls.mock_client)
+
     def setUp(self):
-        self.mock_client = MagicMock()
-        self.mock_models = MagicMock()
-        self.mock_client.client = MagicMock()
-        self.mock_client.client.list_databases = MagicMock()
-        self.users = Users(self.mock_models, self.mock_client)
-        
+        self.mock_client.reset_mock(return_value=True, side_effect=True)
+        self.mock_models.reset_mock(return_value=True, side_effect=True)
+        self.users = copy(self._users_proto)
+
+class TestUsersUnit(UsersFixtureMixin, TestCase):
     def test_init_success(self):
         """Test successful initialization of Users class"""
         self.assertEqual(self.users.client, self.mock_client)
@@ -27,17 +40,20 @@ class TestUsersUnit(TestCase):
     def test_get_users_list_exception(self):
         """Test exception handling in get_users_list"""
         self.mock_client.client.list_databases.side_effect = Exception("Database error")
-        with self.assertRaises(Exception):
+        with self.assertRaises(Exception) as ctx:
             self.users.get_users_list()
+        self.assertEqual(str(ctx.exception), "Database error")
 
-class TestAUsersUnit(IsolatedAsyncioTestCase):
+class TestAUsersUnit(UsersFixtureMixin, IsolatedAsyncioTestCase):
     def setUp(self):
-        self.mock_client = MagicMock()
-        self.mock_models = MagicMock()
+        super().setUp()
         self.mock_milvus_db = MagicMock()
         self.mock_sqlite_db = MagicMock()
         self.mock_codebases_instance = MagicMock()
-        self.users = Users(self.mock_models, self.mock_client)
+        codebases_patcher = patch('pyfiles.bases.users.Codebases')
+        self.mock_codebases_cls = codebases_patcher.start()
+        self.addCleanup(codebases_patcher.stop)
+        self.mock_codebases_cls.return_value = self.mock_codebases_instance
         self.users.get_users_list = MagicMock()
         self.users.get_current_user = AsyncMock()
         self.users.selected_user = MagicMock()
@@ -58,43 +74,47 @@ class TestAUsersUnit(IsolatedAsyncioTestCase):
     async def test_create_new_user_exception(self):
         """Test exception handling in create_new_user"""
         self.users.get_users_list.side_effect = Exception("List error")
-        with self.assertRaises(Exception):
-            await self.users.create_new_user("test_user")
-            
+        with self.assertRaises(Exception) as ctx:
+            await self.users.create_new_user("test_user", "test_user")
+        self.assertEqual(str(ctx.exception), "List error")
+
     async def test_delete_user_exception(self):
         """Test exception handling in delete_user"""
         self.users.selected_user.sqlite_db.get_codebase_list.side_effect = Exception("DB error")
-        with self.assertRaises(Exception):
+        with self.assertRaises(Exception) as ctx:
             await self.users.delete_user("test_user")
-                
+        self.assertEqual(str(ctx.exception), "DB error")
+
     async def test_get_current_user_exception(self):
         """Test exception handling in get_current_user"""
         users = Users(self.mock_models, self.mock_client)
         users._get_selected_codebases = AsyncMock(side_effect=Exception("Codebase error"))
-        with self.assertRaises(Exception):
+        with self.assertRaises(Exception) as ctx:
             await users.get_current_user("test_user")
-                
+        self.assertEqual(str(ctx.exception), "Codebase error")
+
     async def test_get_selected_codebases_exception(self):
         """Test exception handling in _get_selected_codebases"""
-        self.mock_codebases_instance.initialize_default_codebase = AsyncMock(return_value=None)
-        with patch('pyfiles.bases.codebases.Codebases', return_value=self.mock_codebases_instance):
-            with self.assertRaises(Exception):
-                await self.users._get_selected_codebases(self.mock_milvus_db, self.mock_sqlite_db)
-                    
+        self.mock_codebases_cls.side_effect = Exception("Codebases error")
+        with self.assertRaises(Exception) as ctx:
+            await self.users._get_selected_codebases(self.mock_milvus_db, self.mock_sqlite_db)
+        self.assertEqual(str(ctx.exception), "Codebases error")
+
     async def test_get_selected_ext_codebases_exception(self):
         """Test exception handling in _get_selected_ext_codebases"""
         with patch('pyfiles.bases.logger') as mock_logger:
             self.mock_codebases_instance.initialize_default_codebase = AsyncMock(side_effect=Exception("Init error"))
-            with patch('pyfiles.bases.codebases.Codebases', return_value=self.mock_codebases_instance):
-                with self.assertRaises(Exception):
-                    await self.users._get_selected_ext_codebases(self.mock_milvus_db, self.mock_sqlite_db)
-                    
+            with self.assertRaises(Exception) as ctx:
+                await self.users._get_selected_ext_codebases(self.mock_milvus_db, self.mock_sqlite_db)
+            self.assertEqual(str(ctx.exception), "Init error")
+
     async def test_get_user_state_details_exception(self):
         """Test exception handling in get_user_state_details"""
         self.users.get_current_user = AsyncMock(side_effect=Exception("Current user error"))
-        with self.assertRaises(Exception):
+        with self.assertRaises(Exception) as ctx:
             await self.users.get_user_state_details("test_user", "test_codebase")
-                
+        self.assertEqual(str(ctx.exception), "Current user error")
+
     async def test_fix_name_edge_cases(self):
         """Test edge cases in _fix_name method"""
         result = self.users._fix_name("")
@@ -1,24 +1,25 @@
 ## tests.unit.bases.test_unit_users
-from unittest import TestCase, IsolatedAsyncioTestCase
+from unittest import TestCase
 import tempfile
 import os
 import aiosqlite
+from json import dumps
 from unittest.mock import patch, AsyncMock
-from langchain_classic.docstore.document import Document
+from langchain_core.documents import Document
+from pyfiles.databases import sqlite as sqlite_module
 from pyfiles.databases.sqlite import SQLiteDB
+from tests.unit.async_case import SharedLoopTestCase
 
 class TestSQLiteUnit(TestCase):
     def setUp(self):
         self.db_path = ':memory:'
-        self.temp_dir = tempfile.mkdtemp()
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.temp_dir = self._temp_dir.name
         self.temp_db_path = os.path.join(self.temp_dir, 'test.db')
         self.db = SQLiteDB(self.temp_db_path)
 
     def tearDown(self):
-        if os.path.exists(self.temp_dir):
-            for file in os.listdir(self.temp_dir):
-                os.remove(os.path.join(self.temp_dir, file))
-            os.rmdir(self.temp_dir)
+        self._temp_dir.cleanup()
 
     def test_init_memory_db(self):
         """Test successful initialization with memory database"""
@@ -28,13 +29,21 @@ class TestSQLiteUnit(TestCase):
     def test_init_file_db(self):
         """Test successful initialization with file database"""
         self.assertEqual(self.db.db_path, self.temp_db_path)
+        self.assertFalse(self.db.uri)
+
+    def test_init_uri_db(self):
+        """Test successful initialization with a URI database"""
+        db = SQLiteDB('file:test?mode=memory&cache=shared', uri=True)
+        self.assertTrue(db.uri)
 
     def test_delete_db_file_success(self):
         """Test successful deletion of database file"""
         with open(self.temp_db_path, 'w') as f:
             f.write('test')
+        self.db._schema_ready = True
         self.db.delete_db_file()
         self.assertFalse(os.path.exists(self.temp_db_path))
+        self.assertFalse(self.db._schema_ready)
 
     def test_delete_db_file_not_exists(self):
         """Test deletion of non-existent database file"""
@@ -44,133 +53,194 @@ class TestSQLiteUnit(TestCase):
             self.fail(f"delete_db_file raised exception: {e}")
 
 
-class TestASQLiteUnit(IsolatedAsyncioTestCase):
-    def setUp(self):
-        self.db_path = ':memory:'
-        self.temp_dir = tempfile.mkdtemp()
-        self.temp_db_path = os.path.join(self.temp_dir, 'test.db')
-        self.db = SQLiteDB(self.temp_db_path)
-
-    def tearDown(self):
-        if os.path.exists(self.temp_dir):
-            for file in os.listdir(self.temp_dir):
-                os.remove(os.path.join(self.temp_dir, file))
-            os.rmdir(self.temp_dir)
+class TestASQLiteUnit(SharedLoopTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        ## Documents are only read by the tests, so build them once
+        cls.DOC_A = Document(page_content="Content 1", metadata={"group": "test_group"})
+        cls.DOC_B = Document(page_content="Content 2", metadata={"group": "test_group"})
+        cls.DOC_SOURCE = Document(page_content="Content", metadata={"source": "test_source", "group": "test_group"})
+        cls.DOC_CODEBASE_1 = Document(page_content="Content 1", metadata={"group": "codebase_1", "codebase_type": "type1"})
+        cls.DOC_CODEBASE_2 = Document(page_content="Content 2", metadata={"group": "codebase_2", "codebase_type": "type1"})
+
+    async def asyncSetUp(self):
+        ## Named in-memory DB shared by every connection of this test
+        self.temp_db_path = f'file:pycoder_test_{id(self)}?mode=memory&cache=shared'
+        ## A shared-cache memory DB only lives while a connection is open,
+        ## so keep one for the whole test and reuse it for verification queries
+        ## Autocommit mode, so reads skip the implicit transaction and seeds manage their own
+        self._conn = await aiosqlite.connect(self.temp_db_path, uri=True, isolation_level=None)
+        self.db = SQLiteDB(self.temp_db_path, uri=True)
+        ## URI DBs recreate the schema on every connection, so this only lets `_seed` and `_count_documents` use `self._conn`
+        await self.db._create_table(self._conn)
+
+    async def asyncTearDown(self):
+        await self.db.close()
+        await self._conn.close()
+
+    async def _seed(self, docs, ids):
+        """Seed documents in one explicit transaction through the shared connection."""
+        await self._conn.execute("BEGIN")
+        await self._conn.executemany(
+            "INSERT INTO documents (id, content, metadata) VALUES (?, ?, ?)",
+            [(doc_id, doc.page_content, dumps(doc.metadata)) for doc, doc_id in zip(docs, ids)]
+        )
+        await self._conn.execute("COMMIT")
+
+    async def _count_documents(self):
+        """Count the documents through the shared verification connection."""
+        cursor = await self._conn.execute("SELECT COUNT(*) FROM documents")
+        count = await cursor.fetchone()
+        return count[0]
 
     async def test_create_table_success(self):
         """Test successful table creation"""
-        async with aiosqlite.connect(self.temp_db_path) as conn:
-            await self.db._create_table(conn)
-            cursor = await conn.cursor()
-            await cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='documents'")
-            result = await cursor.fetchone()
-            self.assertIsNotNone(result)
+        await self.db._create_table(self._conn)
+        cursor = await self._conn.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='documents'")
+        result = await cursor.fetchone()
+        self.assertIsNotNone(result)
+
+    async def test_create_table_indexes_used(self):
+        """Test that the queries SQLiteDB runs on the metadata are served by the indexes"""
+        cases = [
+            ("idx_documents_group", sqlite_module._SELECT_BY_GROUP, ("test_group",)),
+            ("idx_documents_source", sqlite_module._DELETE_BY_SOURCE, ("test_source", "test_group")),
+            ("idx_documents_codebase_type", sqlite_module._SELECT_GROUPS_BY_CODEBASE_TYPE, ("type1",))
+        ]
+        for index, query, args in cases:
+            with self.subTest(index=index):
+                cursor = await self._conn.execute(f"EXPLAIN QUERY PLAN {query}", args)
+                plan = " ".join(row[3] for row in await cursor.fetchall())
+                self.assertIn(f"USING INDEX {index}", plan)
+
+    def _file_db_path(self):
+        """Create a temporary directory for the test and return a DB file path in it."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        return os.path.join(temp_dir.name, 'test.db')
+
+    async def test_create_table_marks_schema_ready(self):
+        """Test that the schema is only created once for a file database"""
+        db = SQLiteDB(self._file_db_path())
+        await db.insert_documents([self.DOC_A], ["id1"])
+        self.assertTrue(db._schema_ready)
+        with patch.object(db, '_create_table') as mock_create_table:
+            await db.insert_documents([self.DOC_B], ["id2"])
+        mock_create_table.assert_not_called()
+
+    async def test_create_table_uri_db_not_cached(self):
+        """Test that a URI database recreates the schema once its last connection has closed"""
+        db = SQLiteDB(f'file:pycoder_test_uncached_{id(self)}?mode=memory&cache=shared', uri=True)
+        await db.insert_documents([self.DOC_A], ["id1"])
+        self.assertFalse(db._schema_ready)
+        self.assertEqual(await db.get_documents_by_group("test_group"), [])
+
+    async def test_uri_db_requires_open_connection(self):
+        """Test that a shared-cache URI database only keeps its data while the caller holds a connection"""
+        db_path = f'file:pycoder_test_keepalive_{id(self)}?mode=memory&cache=shared'
+        db = SQLiteDB(db_path, uri=True)
+        conn = await aiosqlite.connect(db_path, uri=True)
+        await db.insert_documents([self.DOC_A], ["id1"])
+        self.assertEqual(len(await db.get_documents_by_group("test_group")), 1)
+        await conn.close()
+        self.assertEqual(await db.get_documents_by_group("test_group"), [])
+
+    async def test_create_table_after_file_deleted(self):
+        """Test that a cached schema is recreated when another manager deletes the file"""
+        db_path = self._file_db_path()
+        db_a = SQLiteDB(db_path)
+        db_b = SQLiteDB(db_path)
+        await db_b.insert_documents([self.DOC_CODEBASE_1], ["id1"])
+        self.assertTrue(db_b._schema_ready)
+        db_a.delete_db_file()
+        self.assertEqual(await db_b.get_codebase_list("type1"), [])
+        self.assertTrue(db_b._schema_ready)
+
+    async def test_create_table_memory_db_not_cached(self):
+        """Test that a plain in-memory database recreates the schema on every connection"""
+        db = SQLiteDB()
+        await db.insert_documents([self.DOC_A], ["id1"])
+        self.assertFalse(db._schema_ready)
+        self.assertEqual(await db.get_documents_by_group("test_group"), [])
+
+    async def test_close_success(self):
+        """Test that closing a file database writes the query planner statistics"""
+        db_path = self._file_db_path()
+        db = SQLiteDB(db_path)
+        await db.insert_documents([self.DOC_A, self.DOC_B], ["id1", "id2"])
+        await db.close()
+        async with aiosqlite.connect(db_path) as conn:
+            cursor = await conn.execute("SELECT DISTINCT tbl FROM sqlite_stat1")
+            self.assertEqual(await cursor.fetchall(), [("documents",)])
+
+    async def test_close_file_not_exists(self):
+        """Test that closing a missing file database doesn't create it"""
+        db_path = self._file_db_path()
+        await SQLiteDB(db_path).close()
+        self.assertFalse(os.path.exists(db_path))
 
     async def test_insert_documents_success(self):
         """Test successful document insertion"""
-        doc1 = Document(page_content="Content 1", metadata={"group": "test_group"})
-        doc2 = Document(page_content="Content 2", metadata={"group": "test_group"})
-        await self.db.insert_documents([doc1, doc2], ["id1", "id2"])
-        async with aiosqlite.connect(self.temp_db_path) as conn:
-            cursor = await conn.cursor()
-            await cursor.execute("SELECT COUNT(*) FROM documents")
-            count = await cursor.fetchone()
-            self.assertEqual(count[0], 2)
+        await self.db.insert_documents([self.DOC_A, self.DOC_B], ["id1", "id2"])
+        self.assertEqual(await self._count_documents(), 2)
+
+    async def test_insert_documents_replace_success(self):
+        """Test that inserting an existing ID replaces the document"""
+        await self.db.insert_documents([self.DOC_A, self.DOC_B], ["id1", "id2"])
+        await self.db.insert_documents([self.DOC_B], ["id1"])
+        self.assertEqual(await self._count_documents(), 2)
+        cursor = await self._conn.execute("SELECT content FROM documents WHERE id = 'id1'")
+        row = await cursor.fetchone()
+        self.assertEqual(row[0], self.DOC_B.page_content)
 
     async def test_get_documents_by_group_success(self):
         """Test successful retrieval of documents by group"""
-        doc1 = Document(page_content="Content 1", metadata={"group": "test_group"})
-        doc2 = Document(page_content="Content 2", metadata={"group": "test_group"})
-        await self.db.insert_documents([doc1, doc2], ["id1", "id2"])
+        await self._seed([self.DOC_A, self.DOC_B], ["id1", "id2"])
         docs = await self.db.get_documents_by_group("test_group")
         self.assertEqual(len(docs), 2)
         
     async def test_delete_documents_by_id_success(self):
         """Test successful deletion of documents by ID"""
-        doc = Document(page_content="Content", metadata={"group": "test_group"})
-        await self.db.insert_documents([doc], ["id1"])
-        async with aiosqlite.connect(self.temp_db_path) as conn:
-            cursor = await conn.cursor()
-            await cursor.execute("SELECT COUNT(*) FROM documents")
-            count = await cursor.fetchone()
-            self.assertEqual(count[0], 1)
+        await self._seed([self.DOC_A], ["id1"])
+        self.assertEqual(await self._count_documents(), 1)
         await self.db.delete_documents_by_id(["id1"])
-        async with aiosqlite.connect(self.temp_db_path) as conn:
-            cursor = await conn.cursor()
-            await cursor.execute("SELECT COUNT(*) FROM documents")
-            count = await cursor.fetchone()
-            self.assertEqual(count[0], 0)
+        self.assertEqual(await self._count_documents(), 0)
 
     async def test_delete_documents_by_source_success(self):
         """Test successful deletion of documents by source"""
-        doc = Document(page_content="Content", metadata={"source": "test_source", "group": "test_group"})
-        await self.db.insert_documents([doc], ["id1"])
-        async with aiosqlite.connect(self.temp_db_path) as conn:
-            cursor = await conn.cursor()
-            await cursor.execute("SELECT COUNT(*) FROM documents")
-            count = await cursor.fetchone()
-            self.assertEqual(count[0], 1)
+        await self._seed([self.DOC_SOURCE], ["id1"])
+        self.assertEqual(await self._count_documents(), 1)
         await self.db.delete_documents_by_source(["test_source"], 'test_group')
-        async with aiosqlite.connect(self.temp_db_path) as conn:
-            cursor = await conn.cursor()
-            await cursor.execute("SELECT COUNT(*) FROM documents")
-            count = await cursor.fetchone()
-            self.assertEqual(count[0], 0)
+        self.assertEqual(await self._count_documents(), 0)
 
     async def test_get_codebase_list_success(self):
         """Test successful retrieval of codebase list"""
-        doc1 = Document(page_content="Content 1", metadata={"group": "codebase_1", "codebase_type": "type1"})
-        doc2 = Document(page_content="Content 2", metadata={"group": "codebase_2", "codebase_type": "type1"})
-        await self.db.insert_documents([doc1, doc2], ["id1", "id2"])
+        await self._seed([self.DOC_CODEBASE_1, self.DOC_CODEBASE_2], ["id1", "id2"])
         codebases = await self.db.get_codebase_list("type1")
         self.assertEqual(len(codebases), 1)
 
     async def test_create_table_exception_handling(self):
         """Test exception handling in _create_table"""
-        with patch('aiosqlite.connect') as mock_connect:
-            mock_connect.side_effect = Exception("Database connection error")
-            with self.assertRaises(Exception):
-                await self.db._create_table()
-
-    async def test_insert_documents_exception_handling(self):
-        """Test exception handling in insert_documents"""
-        with patch('pyfiles.databases.sqlite.connect') as mock_connect:
-            mock_connect.side_effect = Exception("Database connection error")
-            doc = Document(page_content="Content", metadata={"group": "test_group"})
-            with self.assertRaises(Exception):
-                await self.db.insert_documents([doc], ["id1"])
-
-    async def test_get_documents_by_group_exception_handling(self):
-        """Test exception handling in get_documents_by_group"""
-        with patch('pyfiles.databases.sqlite.connect') as mock_connect:
-            mock_connect.side_effect = Exception("Database connection error")
-            with self.assertRaises(Exception):
-                await self.db.get_documents_by_group("test_group")
-
-    async def test_clear_exception_handling(self):
-        """Test exception handling in clear"""
-        with patch('pyfiles.databases.sqlite.connect') as mock_connect:
-            mock_connect.side_effect = Exception("Database connection error")
-            with self.assertRaises(Exception):
-                await self.db.clear()
-
-    async def test_delete_documents_by_id_exception_handling(self):
-        """Test exception handling in delete_documents_by_id"""
-        with patch('pyfiles.databases.sqlite.connect') as mock_connect:
-            mock_connect.side_effect = Exception("Database connection error")
-            with self.assertRaises(Exception):
-                await self.db.delete_documents_by_id(["id1"])
-
-    async def test_delete_documents_by_source_exception_handling(self):
-        """Test exception handling in delete_documents_by_source"""
-        with patch('pyfiles.databases.sqlite.connect') as mock_connect:
-            mock_connect.side_effect = Exception("Database connection error")
-            with self.assertRaises(Exception):
-                await self.db.delete_documents_by_source(["source1"])
-
-    async def test_get_codebase_list_exception_handling(self):
-        """Test exception handling in get_codebase_list"""
-        with patch('pyfiles.databases.sqlite.connect') as mock_connect:
-            mock_connect.side_effect = Exception("Database connection error")
-            with self.assertRaises(Exception):
-                await self.db.get_codebase_list("type1")
\ No newline at end of file
+        mock_conn = AsyncMock()
+        mock_conn.execute.side_effect = Exception("Table creation error")
+        with self.assertRaises(Exception) as ctx:
+            await self.db._create_table(mock_conn)
+        self.assertEqual(str(ctx.exception), "Table creation error")
+
+    async def test_connect_exception_handling(self):
+        """Test exception handling when connecting fails in every DB operation"""
+        cases = [
+            ("insert_documents", ([self.DOC_A], ["id1"])),
+            ("get_documents_by_group", ("test_group",)),
+            ("delete_documents_by_id", (["id1"],)),
+            ("delete_documents_by_source", (["source1"], "test_group")),
+            ("get_codebase_list", ("type1",)),
+            ("close", ())
+        ]
+        with patch.object(sqlite_module, 'connect', side_effect=Exception("Database connection error")):
+            for name, args in cases:
+                with self.subTest(method=name):
+                    with self.assertRaises(Exception) as ctx:
+                        await getattr(self.db, name)(*args)
+                    self.assertEqual(str(ctx.exception), "Database connection error")
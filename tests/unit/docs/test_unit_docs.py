@@ -1,10 +1,13 @@
 ## tests.unit.docs.test_unit_docs
 from unittest import TestCase, IsolatedAsyncioTestCase
 from unittest.mock import MagicMock, patch, AsyncMock
+from tempfile import TemporaryDirectory
+from os.path import join
 from langchain_core.documents import Document
 from uuid import uuid4
 from pyfiles.databases.sqlite import SQLiteDB
 from pyfiles.docs.docs_handler import Docs
+from tests.unit.mocks import spec_mock
 
 class TestDocsUnit(TestCase):
     def setUp(self):
@@ -55,6 +58,20 @@ class TestDocsUnit(TestCase):
                 docs.split(mock_splitter)
 
 class TestADocsUnit(IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls):
+        ## Real files in a temporary directory, so the loaders run without patching the filesystem
+        cls._temp_dir = TemporaryDirectory()
+        cls.py_file = join(cls._temp_dir.name, "file1.py")
+        cls.txt_file = join(cls._temp_dir.name, "file.txt")
+        for path in (cls.py_file, cls.txt_file):
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("x = 1\n")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._temp_dir.cleanup()
+
     def setUp(self):
         self.mock_db = AsyncMock()
         self.mock_docs = MagicMock()
@@ -64,22 +81,13 @@ class TestADocsUnit(IsolatedAsyncioTestCase):
         docs_instance = Docs(
             codebase_type="test_type",
             group="test_group", 
-            db=self.mock_db
+            db=self.mock_db,
+            files=[self.py_file]
         )
-        with patch('os.path.abspath') as mock_abspath, \
-             patch('os.path.isdir') as mock_isdir, \
-             patch('os.walk') as mock_walk, \
-             patch('os.path.isfile') as mock_isfile, \
-             patch('builtins.open', new_callable=MagicMock) as mock_open:
-            mock_abspath.return_value = "/test/file.py"
-            mock_isdir.return_value = False
-            mock_isfile.return_value = True
-            mock_walk.return_value = [("/test", [], ["file1.py"])]
-            with patch('pyfiles.docs.docs_handler.PythonLoader') as mock_loader:
-                mock_doc = Document(page_content="test content")
-                mock_loader.return_value.alazy_load.return_value = [mock_doc]
-                result_docs = await docs_instance.acreate_docs()
-                self.assertIsInstance(result_docs, list)
+        result_docs = await docs_instance.acreate_docs()
+        self.assertIsInstance(result_docs, list)
+        self.assertEqual(result_docs[0].metadata["source"], "file1.py")
+        self.assertIn("x = 1", result_docs[0].page_content)
 
     async def test_acreate_docs_with_nonexistent_file(self):
         """Test document creation with non-existent file"""
@@ -87,12 +95,10 @@ class TestADocsUnit(IsolatedAsyncioTestCase):
             codebase_type="test_type",
             group="test_group", 
             db=self.mock_db,
-            files=["nonexistent.py"]
+            files=[join(self._temp_dir.name, "nonexistent.py")]
         )
-        with patch('os.path.isfile') as mock_isfile:
-            mock_isfile.return_value = False
-            result_docs = await docs_instance.acreate_docs()
-            self.assertIsInstance(result_docs, list)
+        result_docs = await docs_instance.acreate_docs()
+        self.assertEqual(result_docs, [])
 
     async def test_acreate_docs_with_invalid_file_type(self):
         """Test document creation with invalid file type"""
@@ -100,12 +106,10 @@ class TestADocsUnit(IsolatedAsyncioTestCase):
             codebase_type="test_type",
             group="test_group", 
             db=self.mock_db,
-            files=["file.txt"]
+            files=[self.txt_file]
         )
-        with patch('os.path.isfile') as mock_isfile:
-            mock_isfile.return_value = True
-            result_docs = await docs_instance.acreate_docs()
-            self.assertIsInstance(result_docs, list)
+        result_docs = await docs_instance.acreate_docs()
+        self.assertEqual(result_docs, [])
 
     async def test_acreate_docs_with_content_list_sqlite(self):
         """Test document creation with content list for SQLite DB"""
@@ -125,7 +129,8 @@ class TestADocsUnit(IsolatedAsyncioTestCase):
 
     async def test_aadd_to_sqlite_success(self):
         """Test successful addition of documents to SQLite DB."""
-        mock_db = MagicMock(spec=SQLiteDB)
+        ## aadd_to_sqlite checks isinstance, so the mock must still look like an SQLiteDB
+        mock_db = spec_mock(SQLiteDB, instance=True)
         mock_db.insert_documents = AsyncMock()
         docs_instance = Docs(
             codebase_type="user",
@@ -2,40 +2,49 @@
 from unittest import TestCase
 from unittest.mock import patch, MagicMock
 import ast
-from langchain_classic.schema import Document
+from functools import lru_cache
+from langchain_core.documents import Document
 from pyfiles.docs.ast_code_splitter import ASTCodeSplitter 
 
+## A short Python snippet that will generate several document types
+_SIMPLE_CODE = (
+    "import os\n"
+    "x = 42\n\n"
+    "def foo():\n"
+    "    return x\n\n"
+    "class Bar:\n"
+    "    def __init__(self, y):\n"
+    "        self.y = y\n"
+    "    def bar(self):\n"
+    "        return self.y\n"
+)
+
+## The helpers are cached, so each snippet is parsed once per run
+## The splitter only reads the nodes, so the cached nodes are shared between tests
+@lru_cache(maxsize=None)
+def _make_func_def():
+    """Return the AST node for `def foo(): pass`."""
+    return ast.parse("def foo():\n    pass\n").body[0]
+
+@lru_cache(maxsize=None)
+def _make_import_node():
+    """Return the AST node for `import os, sys`."""
+    return ast.parse("import os, sys\n").body[0]
+
+@lru_cache(maxsize=None)
+def _make_assign_nodes():
+    """Return a tuple of assignment nodes: `a = 1; b = 'x'`."""
+    tree = ast.parse("a = 1\nb = 'x'\n")
+    return tuple(node for node in tree.body if isinstance(node, ast.Assign))
+
 class TestPythonSplitterUnit(TestCase):
-    @staticmethod
-    def _make_func_def():
-        """Return the AST node for `def foo(): pass`."""
-        return ast.parse("def foo():\n    pass\n").body[0]
-
-    @staticmethod
-    def _make_import_node():
-        """Return the AST node for `import os, sys`."""
-        return ast.parse("import os, sys\n").body[0]
-
-    @staticmethod
-    def _make_assign_nodes():
-        """Return a list of assignment nodes: `a = 1; b = 'x'`."""
-        tree = ast.parse("a = 1\nb = 'x'\n")
-        return [node for node in tree.body if isinstance(node, ast.Assign)]
-
-    @staticmethod
-    def _simple_code():
-        """A short Python snippet that will generate several document types."""
-        return (
-            "import os\n"
-            "x = 42\n\n"
-            "def foo():\n"
-            "    return x\n\n"
-            "class Bar:\n"
-            "    def __init__(self, y):\n"
-            "        self.y = y\n"
-            "    def bar(self):\n"
-            "        return self.y\n"
-        )
+    @classmethod
+    def setUpClass(cls):
+        """Build one splitter per snippet, shared by the tests that only read it."""
+        cls._splitter_small = ASTCodeSplitter("test.py", "import os\nx = 1\n")
+        cls._splitter_imports = ASTCodeSplitter("test.py", "import os\nimport sys\n")
+        cls._splitter_assigns = ASTCodeSplitter("test.py", "a = 1\nb = 'x'\n")
+        cls._splitter_simple = ASTCodeSplitter("test.py", _SIMPLE_CODE)
 
     def test_init_success(self):
         """Test successful initialization of ASTCodeSplitter."""
@@ -55,9 +64,8 @@ class TestPythonSplitterUnit(TestCase):
 
     def test_create_document_success(self):
         """Test successful document creation."""
-        code = "import os\nx = 1\n"
-        splitter = ASTCodeSplitter("test.py", code)
-        func_node = self._make_func_def()
+        splitter = self._splitter_small
+        func_node = _make_func_def()
         doc = splitter._create_document(
             node=func_node,
             content="def foo():\n    pass\n",
@@ -71,13 +79,12 @@ class TestPythonSplitterUnit(TestCase):
 
     def test_create_document_failure(self):
         """Test document creation failure."""
-        code = "import os\nx = 1\n"
-        splitter = ASTCodeSplitter("test.py", code)
+        splitter = self._splitter_small
         with patch('pyfiles.docs.ast_code_splitter.Document') as mock_document:
             mock_document.side_effect = Exception("Document creation failed")
             with self.assertRaises(Exception):
                 splitter._create_document(
-                    node=self._make_func_def(),
+                    node=_make_func_def(),
                     content="def foo():\n    pass\n",
                     section_type="function",
                     name="foo"
@@ -85,8 +92,7 @@ class TestPythonSplitterUnit(TestCase):
 
     def test_prepend_comments_success(self):
         """Test successful comment prepending."""
-        code = "import os\nx = 1\n"
-        splitter = ASTCodeSplitter("test.py", code)
+        splitter = self._splitter_small
         comments = ["# This is a comment", "# Another comment"]
         result = splitter._prepend_comments("x = 1", comments)
         expected = "# This is a comment\n# Another comment\nx = 1"
@@ -94,8 +100,7 @@ class TestPythonSplitterUnit(TestCase):
 
     def test_prepend_comments_failure(self):
         """Test comment prepending failure."""
-        code = "import os\nx = 1\n"
-        splitter = ASTCodeSplitter("test.py", code)
+        splitter = self._splitter_small
         result = splitter._prepend_comments(None, [])
         self.assertIsNone(result)
         result = splitter._prepend_comments("content", None)
@@ -103,9 +108,8 @@ class TestPythonSplitterUnit(TestCase):
 
     def test_process_import_group_success(self):
         """Test successful import group processing."""
-        code = "import os\nimport sys\n"
-        splitter = ASTCodeSplitter("test.py", code)
-        import_node = self._make_import_node()
+        splitter = self._splitter_imports
+        import_node = _make_import_node()
         documents = []
         splitter._process_import_group(documents, [import_node], [])
         self.assertEqual(len(documents), 1)
@@ -113,20 +117,18 @@ class TestPythonSplitterUnit(TestCase):
 
     def test_process_import_group_failure(self):
         """Test import group processing failure."""
-        code = "import os\nimport sys\n"
-        splitter = ASTCodeSplitter("test.py", code)
+        splitter = self._splitter_imports
         with patch('pyfiles.docs.ast_code_splitter.get_source_segment') as mock_get_segment:
             mock_get_segment.side_effect = Exception("Source segment failed")
             documents = []
-            import_node = self._make_import_node()
+            import_node = _make_import_node()
             with self.assertRaises(Exception):
                 splitter._process_import_group(documents, [import_node], [])
 
     def test_process_assign_group_success(self):
         """Test successful assignment group processing."""
-        code = "a = 1\nb = 'x'\n"
-        splitter = ASTCodeSplitter("test.py", code)
-        assign_nodes = self._make_assign_nodes()
+        splitter = self._splitter_assigns
+        assign_nodes = list(_make_assign_nodes())
         documents = []
         splitter._process_assign_group(documents, assign_nodes, [])
         self.assertEqual(len(documents), 1)
@@ -134,19 +136,17 @@ class TestPythonSplitterUnit(TestCase):
 
     def test_process_assign_group_failure(self):
         """Test assignment group processing failure."""
-        code = "a = 1\nb = 'x'\n"
-        splitter = ASTCodeSplitter("test.py", code)
+        splitter = self._splitter_assigns
         with patch('pyfiles.docs.ast_code_splitter.get_source_segment') as mock_get_segment:
             mock_get_segment.side_effect = Exception("Source segment failed")
             documents = []
-            assign_nodes = self._make_assign_nodes()
+            assign_nodes = list(_make_assign_nodes())
             with self.assertRaises(Exception):
                 splitter._process_assign_group(documents, assign_nodes, [])
 
     def test_process_nodes_success(self):
         """Test successful node processing."""
-        code = self._simple_code()
-        splitter = ASTCodeSplitter("test.py", code)
+        splitter = self._splitter_simple
         documents = splitter._process_nodes(splitter.tree.body)
         self.assertGreater(len(documents), 0)
         section_types = [doc.metadata["section_type"] for doc in documents]
@@ -157,8 +157,7 @@ class TestPythonSplitterUnit(TestCase):
 
     def test_process_nodes_failure(self):
         """Test node processing failure."""
-        code = self._simple_code()
-        splitter = ASTCodeSplitter("test.py", code)
+        splitter = self._splitter_simple
         with patch('pyfiles.docs.ast_code_splitter.get_source_segment') as mock_get_segment:
             mock_get_segment.side_effect = Exception("Source segment failed")
             with self.assertRaises(Exception):
@@ -166,8 +165,7 @@ class TestPythonSplitterUnit(TestCase):
 
     def test_split_success(self):
         """Test successful document splitting."""
-        code = self._simple_code()
-        splitter = ASTCodeSplitter("test.py", code)
+        splitter = self._splitter_simple
         documents = splitter.split()
         self.assertGreater(len(documents), 0)
         section_types = [doc.metadata["section_type"] for doc in documents]
@@ -178,7 +176,7 @@ class TestPythonSplitterUnit(TestCase):
 
     def test_split_failure(self):
         """Test document splitting failure."""
-        code = self._simple_code()
+        code = _SIMPLE_CODE
         splitter = ASTCodeSplitter("test.py", code)
         with patch.object(splitter, '_process_nodes') as mock_process_nodes:
             mock_process_nodes.side_effect = Exception("Processing failed")
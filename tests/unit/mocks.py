@@ -0,0 +1,55 @@
+### tests.unit.mocks
+## Shared mock helpers for the unit tests.
+
+## External imports
+from functools import lru_cache
+from unittest.mock import MagicMock
+from typing import Tuple
+
+
+@lru_cache(maxsize=None)
+def _spec_names(
+    cls: type
+) -> Tuple[str, ...]:
+    """
+    Get the attribute names of a class to use as a mock spec.
+    Cached so `dir(cls)` is only walked once per class for the whole run.
+
+    Args
+    ------------
+        cls: type
+            The class to build the spec for.
+
+    Returns
+    ------------
+        Tuple[str, ...]:
+            The attribute names of the class.
+    """
+    return tuple(dir(cls))
+
+
+def spec_mock(
+    cls: type,
+    instance: bool = False
+) -> MagicMock:
+    """
+    Create a fresh MagicMock restricted to the attributes of the given class.
+    Each call returns a new mock, so no call state is shared between tests.
+
+    Args
+    ------------
+        cls: type
+            The class to spec the mock against.
+        instance: bool
+            Whether the mock should pass `isinstance(mock, cls)` checks.
+
+    Returns
+    ------------
+        MagicMock:
+            The spec'd mock.
+    """
+    mock = MagicMock(spec=list(_spec_names(cls)))
+    if instance:
+        ## `__class__` is assignable on mocks, so isinstance works without a class spec
+        mock.__class__ = cls
+    return mock
@@ -0,0 +1,67 @@
+### tests.unit.ui.docs_case
+## Shared fixtures for the async docs and external docs interface tests.
+
+## External imports
+from contextlib import contextmanager
+from types import ModuleType
+from unittest.mock import AsyncMock, MagicMock, patch
+from typing import Generator
+
+## Internal imports
+from pyfiles.ui import utils as utils_module
+from tests.unit.ui.interface_case import InterfaceFixtureMixin
+
+
+@contextmanager
+def broken_logger(
+    module: ModuleType
+) -> Generator[MagicMock, None, None]:
+    """
+    Patch the logger of the given interface module so that logging an error raises.
+
+    Args
+    ------------
+        module: ModuleType
+            The interface module whose logger is patched.
+
+    Yields
+    ------------
+        MagicMock:
+            The patched logger.
+    """
+    with patch.object(module, 'logger') as mock_logger:
+        mock_logger.error.side_effect = Exception("Logger error")
+        yield mock_logger
+
+
+class DocsHandlerMixin(InterfaceFixtureMixin):
+    """
+    Class-level stubs for the handlers of the docs and external docs interfaces.
+
+    Both interfaces look up the codebase owner through `utils.handle_current_user`
+    and then work on its current codebase, so the lookup is patched once per class
+    and one owner and codebase stub is shared by all tests. Subclasses set
+    `mock_handle.return_value` in `setUp` to place the owner where their interface expects it.
+    """
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        ## Patch the user lookup for the whole class; each test sets its return value
+        ## The class cleanup stops it even if a later step of the subclass setUpClass raises
+        handle_patcher = patch.object(utils_module, 'handle_current_user', new_callable=AsyncMock)
+        cls.mock_handle = handle_patcher.start()
+        cls.addClassCleanup(handle_patcher.stop)
+        ## One owner and current codebase stub for every test; each test sets the return value it needs
+        cls.mock_codebase = MagicMock()
+        cls.mock_codebase.get_list = AsyncMock(return_value=[("file1.py", "file1"), ("file2.py", "file2")])
+        cls.mock_codebase.create = AsyncMock()
+        cls.mock_codebase.delete = AsyncMock()
+        cls.mock_owner = MagicMock()
+        cls.mock_owner.get_current_codebase.return_value = cls.mock_codebase
+        cls.mock_owner.create_new_codebase = AsyncMock()
+        cls.mock_owner.delete_codebase = AsyncMock()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.mock_handle.reset_mock(return_value=True, side_effect=True)
+        self.mock_owner.reset_mock()
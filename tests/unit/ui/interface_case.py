@@ -0,0 +1,51 @@
+### tests.unit.ui.interface_case
+## Shared class-level fixtures for the UI interface tests.
+
+## External imports
+from types import ModuleType
+from unittest.mock import MagicMock, patch
+
+
+class InterfaceFixtureMixin:
+    """
+    Build the interface under test and its users handler mock once per class.
+
+    The interfaces only store the users handler, so one instance serves every test.
+    Subclasses set `interface_cls` to the interface they test, and `users_mock_cls`
+    to `AsyncMock` when its handlers await the users methods. `setUp` resets the
+    users mock, so each test sets the return values it needs.
+    """
+    interface_cls: type
+    users_mock_cls: type = MagicMock
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.mock_users = cls.users_mock_cls()
+        cls.interface = cls.interface_cls(cls.mock_users)
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.mock_users.reset_mock(return_value=True, side_effect=True)
+
+
+class LoggerPatchMixin:
+    """
+    Patch the `logger` of `logger_module` once per class.
+
+    Subclasses set `logger_module` to the interface module whose logger they
+    assert on. The patch is stopped by a class cleanup, so it doesn't leak if a
+    later step of the subclass `setUpClass` raises, and `setUp` clears its calls.
+    """
+    logger_module: ModuleType
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        logger_patcher = patch.object(cls.logger_module, 'logger')
+        cls.mock_logger = logger_patcher.start()
+        cls.addClassCleanup(logger_patcher.stop)
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.mock_logger.reset_mock()
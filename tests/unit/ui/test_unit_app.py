@@ -1,36 +1,38 @@
 ## tests.unit.ui.test_unit_app
-from unittest import TestCase, IsolatedAsyncioTestCase
+from unittest import TestCase
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 from pyfiles.ui.gradio_config import Config
 from pyfiles.agents.models import Models
 from pyfiles.databases.milvus import MilvusClientStart
 from pyfiles.ui.gradio_app import GradioApp
+from tests.unit.async_case import SharedLoopTestCase
 
 class TestUIAppUnit(TestCase):
-    def setUp(self):
-        self.config = MagicMock(spec=Config)
-        self.models = MagicMock(spec=Models)
-        self.milvus_client = MagicMock(spec=MilvusClientStart)
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        ## GradioApp only stores these and the tests only check identity,
+        ## so plain placeholders stand in for the spec'd mocks
+        cls.config = SimpleNamespace()
+        cls.models = SimpleNamespace()
+        cls.milvus_client = SimpleNamespace()
+        ## The tests only read the app, so one instance serves the whole class
+        cls.app = GradioApp(
+            config=cls.config,
+            models=cls.models,
+            milvus_client=cls.milvus_client
+        )
 
     def test_init_success(self):
         """Test successful initialization of GradioApp"""
-        app = GradioApp(
-            config=self.config,
-            models=self.models,
-            milvus_client=self.milvus_client
-        )
-        self.assertEqual(app.config, self.config)
-        self.assertEqual(app.models, self.models)
-        self.assertEqual(app.milvus_client, self.milvus_client)
+        self.assertEqual(self.app.config, self.config)
+        self.assertEqual(self.app.models, self.models)
+        self.assertEqual(self.app.milvus_client, self.milvus_client)
 
     def test_create_dynamic_states_success(self):
         """Test successful creation of dynamic states"""
-        app = GradioApp(
-            config=self.config,
-            models=self.models,
-            milvus_client=self.milvus_client
-        )
-        result = app._create_dynamic_states(
+        result = self.app._create_dynamic_states(
             initial_user_name="test_user",
             initial_codebase_name="test_codebase",
             initial_thread="thread_1",
@@ -49,15 +51,10 @@ class TestUIAppUnit(TestCase):
 
     def test_create_dynamic_states_exception(self):
         """Test exception handling in create_dynamic_states"""
-        app = GradioApp(
-            config=self.config,
-            models=self.models,
-            milvus_client=self.milvus_client
-        )
         with patch('pyfiles.ui.gradio_app.logger') as mock_logger:
             mock_logger.info.side_effect = Exception("Dynamic states error")
             with self.assertRaises(Exception) as context:
-                app._create_dynamic_states(
+                self.app._create_dynamic_states(
                     initial_user_name="test_user",
                     initial_codebase_name="test_codebase",
                     initial_thread="thread_1",
@@ -68,11 +65,18 @@ class TestUIAppUnit(TestCase):
                 )
             self.assertIn("Dynamic states error", str(context.exception))
 
-class TestAUIAppUnit(IsolatedAsyncioTestCase):
+class TestAUIAppUnit(SharedLoopTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        ## Build the spec'd mocks once per class; setUp resets their call state
+        cls.config = MagicMock(spec=Config)
+        cls.models = MagicMock(spec=Models)
+        cls.milvus_client = MagicMock(spec=MilvusClientStart)
+
     def setUp(self):
-        self.config = MagicMock(spec=Config)
-        self.models = MagicMock(spec=Models)
-        self.milvus_client = MagicMock(spec=MilvusClientStart)
+        for mock in (self.config, self.models, self.milvus_client):
+            mock.reset_mock(return_value=True, side_effect=True)
 
     async def test_create_initial_states_exception(self):
         """Test exception handling in create_initial_states"""
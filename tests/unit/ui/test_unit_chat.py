@@ -1,23 +1,37 @@
 ## tests.unit.ui.test_unit_app
-from unittest import TestCase, IsolatedAsyncioTestCase
+from functools import cached_property
+from unittest import TestCase
+from inspect import isasyncgen
 from unittest.mock import AsyncMock, MagicMock, patch
 from gradio import Markdown
 from gradio_modal import Modal
 from typing import Dict, List, Tuple, AsyncIterator, Any
 from pyfiles.ui.interface_chat import ChatInterface
+from tests.unit.async_case import SharedLoopTestCase
 
-class TestUIChatUnit(TestCase):
+class ChatFixtureMixin:
+    """
+    Patch the chat logger and mock the users handler for each test.
+    The ChatInterface is only built when a test first uses it.
+    """
     def setUp(self):
+        super().setUp()
+        ## Patch the logger once per test instead of decorating each test
+        logger_patcher = patch('pyfiles.ui.interface_chat.logger')
+        self.mock_logger = logger_patcher.start()
+        self.addCleanup(logger_patcher.stop)
         self.mock_users = MagicMock()
-        self.chat_interface = ChatInterface(self.mock_users)
 
+    @cached_property
+    def chat_interface(self):
+        return ChatInterface(self.mock_users)
+
+class TestUIChatUnit(ChatFixtureMixin, TestCase):
     def test_init_success(self):
         """Test successful initialization of ChatInterface"""
-        chat_interface = ChatInterface(self.mock_users)
-        self.assertEqual(chat_interface.users, self.mock_users)
+        self.assertEqual(self.chat_interface.users, self.mock_users)
 
-    @patch('pyfiles.ui.interface_chat.logger')
-    def test_init_exception_handling(self, mock_logger):
+    def test_init_exception_handling(self):
         """Test exception handling during initialization"""
         with patch('pyfiles.ui.interface_chat.ChatInterface.__init__', side_effect=Exception("Init failed")):
             with self.assertRaises(Exception):
@@ -60,8 +74,7 @@ class TestUIChatUnit(TestCase):
             status_messages=mock_status_messages
         )
 
-    @patch('pyfiles.ui.interface_chat.logger')
-    def test_component_triggers_exception_handling(self, mock_logger):
+    def test_component_triggers_exception_handling(self):
         """Test exception handling in component triggers"""
         with patch.object(self.chat_interface, 'component_triggers', side_effect=Exception("Component triggers failed")):
             with self.assertRaises(Exception):
@@ -86,11 +99,7 @@ class TestUIChatUnit(TestCase):
             #mock_logger.error.called_once()
 
 
-class TestAUIChatUnit(IsolatedAsyncioTestCase):
-    def setUp(self):
-        self.mock_users = MagicMock()
-        self.chat_interface = ChatInterface(self.mock_users)
-
+class TestAUIChatUnit(ChatFixtureMixin, SharedLoopTestCase):
     async def test_confirm_deletion_modal_success(self):
         """Test successful deletion confirmation modal creation"""
         mock_user = MagicMock()
@@ -111,18 +120,33 @@ class TestAUIChatUnit(IsolatedAsyncioTestCase):
             self.assertIsInstance(result[0], Modal)
             self.assertIsInstance(result[1], Markdown)
 
-    @patch('pyfiles.ui.interface_chat.logger')
-    async def test_confirm_deletion_modal_exception_handling(self, mock_logger):
-        """Test exception handling in confirm deletion modal"""
+    async def test_handle_current_user_exception_handling(self):
+        """Test that a failing user lookup is logged and raised by every chat handler"""
+        chat_args = dict(user_name="test_user", docs_name="test_docs", ext_docs_list=[])
+        message_args = dict(chat_args, chat_id="chat1", chat_input="test input")
+        cases = [
+            ("_confirm_deletion_modal", dict(chat_args, selected_chat="test_chat")),
+            ("_handle_create_chat_submit", dict(chat_args, chat_name="New Chat")),
+            ("_handle_delete_chat_click", dict(chat_args, chat_id="chat1")),
+            ("_handle_chat_input_submit", message_args),
+            ("_handle_chat_undo_submit", message_args),
+            ("_handle_chat_retry_submit", message_args),
+            ("_handle_chat_edit_submit", dict(message_args, edit_data=MagicMock()))
+        ]
         with patch('pyfiles.ui.utils.handle_current_user', side_effect=Exception("User handling failed")):
-            with self.assertRaises(Exception):
-                await self.chat_interface._confirm_deletion_modal(
-                    selected_chat="test_chat",
-                    user_name="test_user",
-                    docs_name="test_docs",
-                    ext_docs_list=[]
-                )
-                mock_logger.error.assert_called_once()
+            for name, kwargs in cases:
+                with self.subTest(method=name):
+                    self.mock_logger.reset_mock()
+                    with self.assertRaises(Exception) as ctx:
+                        result = getattr(self.chat_interface, name)(**kwargs)
+                        ## The chat message handlers are async generators, the others coroutines
+                        if isasyncgen(result):
+                            async for _ in result:
+                                pass
+                        else:
+                            await result
+                    self.assertEqual(str(ctx.exception), "User handling failed")
+                    self.mock_logger.error.assert_called_once()
 
     async def test_handle_create_chat_submit_success(self):
         """Test successful chat creation"""
@@ -141,19 +165,6 @@ class TestAUIChatUnit(IsolatedAsyncioTestCase):
             self.assertIsInstance(result, tuple)
             self.assertEqual(len(result), 5)
 
-    @patch('pyfiles.ui.interface_chat.logger')
-    async def test_handle_create_chat_submit_exception_handling(self, mock_logger):
-        """Test exception handling in chat creation"""
-        with patch('pyfiles.ui.utils.handle_current_user', side_effect=Exception("User handling failed")):
-            with self.assertRaises(Exception):
-                await self.chat_interface._handle_create_chat_submit(
-                    user_name="test_user",
-                    docs_name="test_docs",
-                    ext_docs_list=[],
-                    chat_name="New Chat"
-                )
-            mock_logger.error.assert_called_once()
-
     async def test_handle_delete_chat_click_success(self):
         """Test successful chat deletion"""
         mock_user = MagicMock()
@@ -171,88 +182,7 @@ class TestAUIChatUnit(IsolatedAsyncioTestCase):
             self.assertIsInstance(result, tuple)
             self.assertEqual(len(result), 5)
 
-    @patch('pyfiles.ui.interface_chat.logger')
-    async def test_handle_delete_chat_click_exception_handling(self, mock_logger):
-        """Test exception handling in chat deletion"""
-        with patch('pyfiles.ui.utils.handle_current_user', side_effect=Exception("User handling failed")):
-            with self.assertRaises(Exception):
-                await self.chat_interface._handle_delete_chat_click(
-                    user_name="test_user",
-                    docs_name="test_docs",
-                    ext_docs_list=[],
-                    chat_id="chat1"
-                )
-            mock_logger.error.assert_called_once()
-
-    async def test_handle_chat_input_submit_exception_handling(self):
-        """Test exception handling in chat input submission"""
-        with patch('pyfiles.ui.utils.handle_current_user', side_effect=Exception("User handling failed")):
-            with self.assertRaises(Exception):
-                async def collect_responses():
-                    async for response in self.chat_interface._handle_chat_input_submit(
-                        user_name="test_user",
-                        docs_name="test_docs",
-                        ext_docs_list=[],
-                        chat_id="chat1",
-                        convo_history=[],
-                        chat_input="test input"
-                    ):
-                        pass
-                
-                await collect_responses()
-
-    async def test_handle_chat_undo_submit_exception_handling(self):
-        """Test exception handling in chat undo submission"""
-        with patch('pyfiles.ui.utils.handle_current_user', side_effect=Exception("User handling failed")):
-            with self.assertRaises(Exception):
-                async def collect_responses():
-                    async for response in self.chat_interface._handle_chat_undo_submit(
-                        user_name="test_user",
-                        docs_name="test_docs",
-                        ext_docs_list=[],
-                        chat_id="chat1",
-                        convo_history=[],
-                        chat_input="test input"
-                    ):
-                        pass
-                
-                await collect_responses()
-
-    async def test_handle_chat_retry_submit_exception_handling(self):
-        """Test exception handling in chat retry submission"""
-        with patch('pyfiles.ui.utils.handle_current_user', side_effect=Exception("User handling failed")):
-            with self.assertRaises(Exception):
-                async def collect_responses():
-                    async for response in self.chat_interface._handle_chat_retry_submit(
-                        user_name="test_user",
-                        docs_name="test_docs",
-                        ext_docs_list=[],
-                        chat_id="chat1",
-                        convo_history=[],
-                        chat_input="test input"
-                    ):
-                        pass
-                await collect_responses()
-
-    async def test_handle_chat_edit_submit_exception_handling(self):
-        """Test exception handling in chat edit submission"""
-        with patch('pyfiles.ui.utils.handle_current_user', side_effect=Exception("User handling failed")):
-            with self.assertRaises(Exception):
-                async def collect_responses():
-                    async for response in self.chat_interface._handle_chat_edit_submit(
-                        user_name="test_user",
-                        docs_name="test_docs",
-                        ext_docs_list=[],
-                        chat_id="chat1",
-                        convo_history=[],
-                        chat_input="test input",
-                        edit_data=MagicMock()
-                    ):
-                        pass
-                await collect_responses()
-
-    @patch('pyfiles.ui.interface_chat.logger')
-    async def test_create_interface_exception_handling(self, mock_logger):
+    async def test_create_interface_exception_handling(self):
         """Test exception handling in interface creation"""
         with patch.object(self.chat_interface, 'create_interface', side_effect=Exception("Interface creation failed")):
             with self.assertRaises(Exception):
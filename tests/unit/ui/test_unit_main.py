@@ -1,13 +1,36 @@
 ## tests.unit.ui.test_unit_main
-from unittest import TestCase, IsolatedAsyncioTestCase
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest import TestCase
+from unittest.mock import AsyncMock, MagicMock, DEFAULT, patch, sentinel
 from gradio import Radio, CheckboxGroup, Markdown, Textbox, Tab
 from pyfiles.ui.interface_main import MainInterface
+from pyfiles.ui import interface_main as interface_main_module, utils as utils_module
+from tests.unit.async_case import SharedLoopTestCase
+from tests.unit.ui.interface_case import InterfaceFixtureMixin, LoggerPatchMixin
 
-class TestUIMainUnit(TestCase):
-    def setUp(self):
-        self.mock_users = MagicMock()
-        self.main_interface = MainInterface(self.mock_users)
+## The components `create_interface` builds through `utils.create_component`, in creation order
+_CREATED_COMPONENTS = (
+    "status_bar",
+    "selected_user",
+    "selected_docs",
+    "users_btn",
+    "docs_btn",
+    "chats_btn",
+    "ext_docs_btn"
+)
+
+## The configs `create_interface("test_user", "test_docs")` passes to `utils.create_component`, in creation order
+_EXPECTED_CONFIGS = (
+    {"component_type": Markdown, "value": "Welcome!", "container": True},
+    {"component_type": Textbox, "value": "test_user", "interactive": False, "label": "Selected User", "scale": 2},
+    {"component_type": Textbox, "value": "test_docs", "interactive": False, "label": "Selected Docs", "scale": 2},
+    {"component_type": Tab, "label": 'Users'},
+    {"component_type": Tab, "label": 'Docs'},
+    {"component_type": Tab, "label": 'Chats'},
+    {"component_type": Tab, "label": 'External Docs'}
+)
+
+class TestUIMainUnit(InterfaceFixtureMixin, TestCase):
+    interface_cls = MainInterface
     
     def test_init_success(self):
         """Test successful initialization"""
@@ -22,15 +45,14 @@ class TestUIMainUnit(TestCase):
         with patch('pyfiles.ui.interface_main.logger') as mock_logger:
             interface = MainInterface(mock_users)
 
-class TestAUIMainUnit(IsolatedAsyncioTestCase):
-    
-    def setUp(self):
-        self.mock_users = MagicMock()
-        self.main_interface = MainInterface(self.mock_users)
+class TestAUIMainUnit(InterfaceFixtureMixin, LoggerPatchMixin, SharedLoopTestCase):
+    interface_cls = MainInterface
+    ## The handlers await the users methods, so the shared mock is async
+    users_mock_cls = AsyncMock
+    logger_module = interface_main_module
 
     async def test_handle_user_change_success(self):
-        mock_users = AsyncMock()
-        mock_users.get_user_state_details.return_value = (
+        self.mock_users.get_user_state_details.return_value = (
             "test_user",
             "test_codebase",
             ["choice1", "choice2"],
@@ -38,111 +60,54 @@ class TestAUIMainUnit(IsolatedAsyncioTestCase):
             "ext_choice1"
         )
         mock_utils = MagicMock()
-        mock_utils.toggle_del_button.return_value = MagicMock()
-        main_interface = MainInterface(users=mock_users)
+        mock_utils.toggle_del_button.return_value = sentinel.del_button
         with patch('pyfiles.ui.interface_main.utils', mock_utils):
-            result = await main_interface._handle_user_change(
+            result = await self.interface._handle_user_change(
                 user_name="test_user",
                 docs_name="test_codebase"
             )
-            assert len(result) == 8
-            assert result[0] == "test_user"
-            assert result[1] == "test_codebase"
-            assert result[2] == "test_codebase"
-            assert isinstance(result[3], Radio)
-            assert isinstance(result[5], Radio)
-            assert isinstance(result[7], CheckboxGroup)
-            mock_users.get_user_state_details.assert_called_once_with("test_user", "test_codebase")
+            self.assertEqual(len(result), 8)
+            self.assertEqual(result[:3], ("test_user", "test_codebase", "test_codebase"))
+            ## The Radio and CheckboxGroup components are built directly, so check their exact types at once
+            self.assertEqual(tuple(type(result[i]) for i in (3, 5, 7)), (Radio, Radio, CheckboxGroup))
+            self.assertIs(result[4], sentinel.del_button)
+            self.assertIs(result[6], sentinel.del_button)
+            self.mock_users.get_user_state_details.assert_called_once_with("test_user", "test_codebase")
     
     async def test_handle_user_change_exception_handling(self):
         """Test exception handling in user change handler"""
         user_name = "test_user"
         docs_name = "test_docs"
-        with patch('pyfiles.ui.interface_main.logger') as mock_logger:
-            self.mock_users.get_user_state_details.side_effect = Exception("User change failed")
-            with self.assertRaises(Exception):  
-                result = await self.main_interface._handle_user_change(user_name, docs_name)
-            mock_logger.error.assert_called_once()
-    
-    async def test_handle_docs_change_exception_handling(self):
-        """Test exception handling in docs change handler"""
-        user_name = "test_user"
-        docs_name = "test_docs"
-        ext_docs_list = ["ext1", "ext2"]    
-        with patch('pyfiles.ui.interface_main.logger') as mock_logger:
-            self.mock_users.handle_current_user = AsyncMock(side_effect=Exception("Docs change failed"))
-            with self.assertRaises(Exception):  
-                result = await self.main_interface._handle_docs_change(user_name, docs_name, ext_docs_list)
-            mock_logger.error.assert_called_once()
-    
-    async def test_handle_chats_change_exception_handling(self):
-        """Test exception handling in chats change handler"""
-        user_name = "test_user"
-        docs_name = "test_docs"
-        ext_docs_list = ["ext1", "ext2"]
-        chat_id = "chat_id"
-        with patch('pyfiles.ui.interface_main.utils.handle_current_user', side_effect=Exception("Switch failed")):
-            with patch('pyfiles.ui.interface_main.logger') as mock_logger:
-                with self.assertRaises(Exception):
-                    await self.main_interface._handle_chats_change(user_name, docs_name, ext_docs_list, chat_id)
+        self.mock_users.get_user_state_details.side_effect = Exception("User change failed")
+        with self.assertRaises(Exception):  
+            result = await self.interface._handle_user_change(user_name, docs_name)
+        self.mock_logger.error.assert_called_once()
     
-    async def test_handle_doc_change_exception_handling(self):
-        """Test exception handling in doc change handler"""
-        user_name = "test_user"
-        docs_name = "test_docs"
-        ext_docs_list = ["ext1", "ext2"]
-        doc_id = "doc_id"
-        with patch('pyfiles.ui.interface_main.utils.handle_current_user', side_effect=Exception("Switch failed")):
-            with patch('pyfiles.ui.interface_main.logger') as mock_logger:
-                with self.assertRaises(Exception):
-                    await self.main_interface._handle_doc_change(user_name, docs_name, ext_docs_list, doc_id)
-                mock_logger.error.assert_called_once()
-    
-    async def test_handle_ext_docs_change_exception_handling(self):
-        """Test exception handling in external docs change handler"""
-        user_name = "test_user"
-        docs_name = "test_docs"
-        ext_docs_list = ["ext1", "ext2"]
-        ext_docs_name = "ext_docs_name"
-        with patch('pyfiles.ui.interface_main.utils.handle_current_user', side_effect=Exception("Switch failed")):
-            with patch('pyfiles.ui.interface_main.logger') as mock_logger:
-                with self.assertRaises(Exception):
-                    await self.main_interface._handle_ext_docs_change(user_name, docs_name, ext_docs_list, ext_docs_name)
-                mock_logger.error.assert_called_once()
-    
-    async def test_handle_ext_doc_change_exception_handling(self):
-        """Test exception handling in external doc change handler"""
-        user_name = "test_user"
-        docs_name = "test_docs"
-        ext_docs_list = ["ext1", "ext2"]
-        ext_docs_name = "ext_docs_name"
-        doc_id = "doc_id"       
-        with patch('pyfiles.ui.interface_main.utils.handle_current_user', side_effect=Exception("Switch failed")):
-            with patch('pyfiles.ui.interface_main.logger') as mock_logger:
-                with self.assertRaises(Exception):
-                    await self.main_interface._handle_ext_doc_change(user_name, docs_name, ext_docs_list, ext_docs_name, doc_id)
-                mock_logger.error.assert_called_once()
+    async def test_handle_current_user_exception_handling(self):
+        """Test that a failing user lookup is logged and raised by every handler"""
+        docs_args = dict(user_name="test_user", docs_name="test_docs", ext_docs_list=["ext1", "ext2"])
+        cases = [
+            ("_handle_docs_change", docs_args),
+            ("_handle_chat_change", dict(docs_args, chat_id="chat_id")),
+            ("_handle_doc_change", dict(docs_args, doc_id="doc_id")),
+            ("_handle_ext_docs_change", dict(docs_args, ext_docs_name="ext_docs_name")),
+            ("_handle_ext_doc_change", dict(docs_args, ext_docs_name="ext_docs_name", doc_id="doc_id"))
+        ]
+        with patch.object(utils_module, 'handle_current_user', side_effect=Exception("Switch failed")):
+            for name, kwargs in cases:
+                with self.subTest(method=name):
+                    self.mock_logger.reset_mock()
+                    with self.assertRaises(Exception) as ctx:
+                        await getattr(self.interface, name)(**kwargs)
+                    self.assertEqual(str(ctx.exception), "Switch failed")
+                    self.mock_logger.error.assert_called_once()
 
     @patch('pyfiles.ui.utils.create_component')
-    @patch('pyfiles.ui.interface_main.Row')
-    @patch('pyfiles.ui.interface_main.Column')
-    @patch('pyfiles.ui.interface_main.HTML')
-    def test_create_interface_success(self, mock_html, mock_column, mock_row, mock_create_component):
-        mock_row_instance = MagicMock()
-        mock_column_instance = MagicMock()
-        mock_html_instance = MagicMock()
-        mock_row.return_value.__enter__.return_value = mock_row_instance
-        mock_column.return_value.__enter__.return_value = mock_column_instance
-        mock_html.return_value = mock_html_instance
-        mock_create_component.side_effect = [
-            MagicMock(),
-            MagicMock(),
-            MagicMock(),
-            MagicMock(),
-            MagicMock(),
-            MagicMock(),
-            MagicMock(),
-        ]
+    @patch.multiple('pyfiles.ui.interface_main', Row=DEFAULT, Column=DEFAULT, HTML=DEFAULT)
+    def test_create_interface_success(self, mock_create_component, **mock_layout):
+        ## MagicMock already supports the `with` protocol, so the layout mocks need no setup
+        ## The created components are only stored, so sentinels stand in for them
+        mock_create_component.side_effect = [getattr(sentinel, name) for name in _CREATED_COMPONENTS]
         users = MagicMock()
         main_interface = MainInterface(users)
         result = main_interface.create_interface("test_user", "test_docs")
@@ -155,25 +120,15 @@ class TestAUIMainUnit(IsolatedAsyncioTestCase):
         self.assertIn('docs_btn', result)
         self.assertIn('chats_btn', result)
         self.assertIn('ext_docs_btn', result)
-        expected_configs = [
-            {"component_type": Markdown, "value": "Welcome!", "container": True},
-            {"component_type": Textbox, "value": "test_user", "interactive": False, "label": "Selected User", "scale": 2},
-            {"component_type": Textbox, "value": "test_docs", "interactive": False, "label": "Selected Docs", "scale": 2},
-            {"component_type": Tab, "label": 'Users'},
-            {"component_type": Tab, "label": 'Docs'},
-            {"component_type": Tab, "label": 'Chats'},
-            {"component_type": Tab, "label": 'External Docs'}
-        ]
-        self.assertEqual(mock_create_component.call_count, 7)
-        for i, call in enumerate(mock_create_component.call_args_list):
-            self.assertEqual(call[0][0], expected_configs[i])
+        for name in _CREATED_COMPONENTS:
+            self.assertIs(result[name], getattr(sentinel, name))
+        self.assertEqual(tuple(call.args[0] for call in mock_create_component.call_args_list), _EXPECTED_CONFIGS)
     
     async def test_create_interface_exception_handling(self):
         """Test exception handling in interface creation"""
         initial_user_name = "test_user"
         initial_docs_name = "test_docs"
-        with patch('pyfiles.ui.interface_main.logger') as mock_logger:
-            with patch('pyfiles.ui.interface_main.Row', side_effect=Exception("Create failed")):
-                with self.assertRaises(Exception):    
-                    result = self.main_interface.create_interface(initial_user_name, initial_docs_name)
-            mock_logger.error.assert_called_once()
+        with patch('pyfiles.ui.interface_main.Row', side_effect=Exception("Create failed")):
+            with self.assertRaises(Exception):    
+                result = self.interface.create_interface(initial_user_name, initial_docs_name)
+        self.mock_logger.error.assert_called_once()
@@ -1,18 +1,12 @@
 ## tests.unit.ui.test_unit_utils
-from unittest import TestCase, IsolatedAsyncioTestCase
+from unittest import TestCase
 from unittest.mock import MagicMock, patch, AsyncMock
 from gradio import Row, Button
 from gradio_modal import Modal
 from pyfiles.ui.utils import cancel_deletion_trigger, create_component, handle_current_user, toggle_visibility
+from tests.unit.async_case import SharedLoopTestCase
 
 class TestUIUtilsUnit(TestCase):
-    
-    def setUp(self):
-        """Set up test fixtures before each test method."""
-        self.mock_logger = MagicMock()
-        with patch('pyfiles.bases.logger.logger', self.mock_logger):
-            pass
-    
     def test_create_component_success(self):
         """Test successful component creation."""
         with patch('gradio.Row') as mock_row:
@@ -27,8 +21,7 @@ class TestUIUtilsUnit(TestCase):
             self.assertEqual(result, mock_component_instance)
             mock_row.assert_called_once_with(elem_id="test_row", visible=True)
     
-    @patch('pyfiles.ui.utils.logger')
-    def test_create_component_exception(self, mock_logger):
+    def test_create_component_exception(self):
         """Test exception handling in component creation."""
         with patch('gradio.Button') as mock_button:
             mock_button.side_effect = Exception("Component creation failed")
@@ -50,24 +43,15 @@ class TestUIUtilsUnit(TestCase):
             self.assertEqual(len(result), 4)
             self.assertEqual(mock_row.call_count, 4) 
     
-    @patch('pyfiles.ui.utils.logger')
-    def test_toggle_visibility_exception(self, mock_logger):
+    def test_toggle_visibility_exception(self):
         """Test exception handling in visibility toggle."""
         with patch('pyfiles.ui.utils.Row') as mock_row:
             mock_row.side_effect = Exception("Visibility toggle failed")
             with self.assertRaises(Exception) as context:
                 toggle_visibility()
 
-class TestAUIUtilsUnit(IsolatedAsyncioTestCase):
-    
-    def setUp(self):
-        """Set up test fixtures before each test method."""
-        self.mock_logger = MagicMock()
-        with patch('pyfiles.bases.logger.logger', self.mock_logger):
-            pass
-    
-    @patch('pyfiles.ui.utils.logger')
-    async def test_handle_current_user_exception(self, mock_logger):
+class TestAUIUtilsUnit(SharedLoopTestCase):
+    async def test_handle_current_user_exception(self):
         """Test exception handling in current user handler."""
         mock_users = AsyncMock()
         mock_users.get_current_user = AsyncMock(side_effect=Exception("User retrieval failed"))